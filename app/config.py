@@ -0,0 +1,70 @@
+"""
+Configuration settings for the TodoList application.
+
+This module reads runtime settings from environment variables so the
+application behaviour can be tuned per deployment without code changes.
+"""
+
+import os
+from typing import Tuple
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """
+    Read a boolean flag from the environment.
+
+    Args:
+        name: Name of the environment variable
+        default: Value used when the variable is not set
+
+    Returns:
+        bool: The parsed flag value
+    """
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _env_tuple(name: str, default: str) -> Tuple[str, ...]:
+    """
+    Read a comma-separated list from the environment.
+
+    Args:
+        name: Name of the environment variable
+        default: Value used when the variable is not set
+
+    Returns:
+        Tuple[str, ...]: The non-empty, stripped list items
+    """
+    value = os.getenv(name, default)
+    return tuple(item.strip() for item in value.split(",") if item.strip())
+
+
+class Settings:
+    """
+    Application settings loaded from environment variables.
+
+    Attributes:
+        debug: Whether development features such as GraphiQL are enabled
+        graphql_cache_enabled: Whether parsed and validated GraphQL documents
+            are cached between requests
+        graphql_cache_size: Maximum number of documents kept in each cache
+        cors_origins: Origins allowed to make cross-origin requests
+        workers: Number of uvicorn worker processes when run as a script
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the settings from the current environment.
+        """
+        self.debug = _env_bool("DEBUG", False)
+        self.graphql_cache_enabled = _env_bool(
+            "GRAPHQL_PARSER_AND_VALIDATION_CACHE", True
+        )
+        self.graphql_cache_size = int(os.getenv("GRAPHQL_CACHE_SIZE", "1024"))
+        self.cors_origins = _env_tuple("CORS_ORIGINS", "*")
+        self.workers = int(os.getenv("WORKERS", "1"))
+
+
+settings = Settings()
@@ -0,0 +1,39 @@
+"""
+GraphQL request context for the TodoList application.
+
+This module builds the per-request context passed to resolvers,
+including the DataLoaders used to batch task lookups.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from strawberry.dataloader import DataLoader
+
+from app.graphql.projection import task_projection
+from app.graphql.types import Task
+
+
+async def load_tasks(task_ids: List[int]) -> List[Optional[Task]]:
+    """
+    Batch-load GraphQL tasks for a DataLoader.
+
+    Args:
+        task_ids: The IDs collected by the loader during one execution tick
+
+    Returns:
+        List[Optional[Task]]: The tasks in the same order as the IDs
+    """
+    return task_projection.get_many(task_ids)
+
+
+async def get_context() -> Dict[str, Any]:
+    """
+    Build the context for a single GraphQL request.
+
+    A new DataLoader is created per request so its cache never outlives
+    the request that filled it.
+
+    Returns:
+        Dict[str, Any]: The resolver context
+    """
+    return {"task_loader": DataLoader(load_fn=load_tasks)}
@@ -0,0 +1,69 @@
+"""
+GraphQL schema extensions for the TodoList application.
+
+This module contains Strawberry schema extensions that post-process
+execution results, such as mapping domain exceptions to GraphQL errors.
+"""
+
+from typing import Iterator, List
+
+from graphql.error import GraphQLError
+from strawberry.extensions import SchemaExtension
+
+from app.models.exceptions import TaskNotFoundException
+
+
+class TaskErrorExtension(SchemaExtension):
+    """
+    Schema extension that formats task errors raised by resolvers.
+
+    Resolvers let TaskNotFoundException propagate; this extension rewrites
+    the resulting GraphQL errors once per operation so every strict
+    resolver reports the same TASK_NOT_FOUND error shape.
+    """
+
+    @staticmethod
+    def format_task_not_found(
+        error: GraphQLError, original_error: TaskNotFoundException
+    ) -> GraphQLError:
+        """
+        Build the GraphQL error for a task that was not found.
+
+        Args:
+            error: The GraphQL error produced during execution
+            original_error: The exception raised by the resolver
+
+        Returns:
+            GraphQLError: The error with the TASK_NOT_FOUND extensions
+        """
+        return GraphQLError(
+            message=str(original_error.detail),
+            nodes=error.nodes,
+            source=error.source,
+            positions=error.positions,
+            path=error.path,
+            original_error=original_error,
+            extensions={
+                "code": "TASK_NOT_FOUND",
+                "task_id": original_error.task_id,
+                "http_status": original_error.status_code,
+            },
+        )
+
+    def on_operation(self) -> Iterator[None]:
+        """
+        Rewrite task errors after the operation has been executed.
+        """
+        yield
+        result = self.execution_context.result
+        if result and result.errors:
+            processed_errors: List[GraphQLError] = []
+            for error in result.errors:
+                if isinstance(error.original_error, TaskNotFoundException):
+                    processed_errors.append(
+                        self.format_task_not_found(error, error.original_error)
+                    )
+                else:
+                    processed_errors.append(error)
+
+            result.errors = processed_errors
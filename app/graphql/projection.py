@@ -0,0 +1,142 @@
+"""
+GraphQL projection of the task store for the TodoList application.
+
+This module builds the Strawberry Task objects served by the resolvers
+from the tasks held by TaskService, and caches them until the stored
+tasks they were built from change.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from app.graphql.types import Task
+from app.models.task import Task as StoredTask
+from app.services import TaskService, task_service_instance
+
+
+def to_graphql_task(task: StoredTask) -> Task:
+    """
+    Build the GraphQL type for a stored task.
+
+    Args:
+        task: The stored task
+
+    Returns:
+        Task: The GraphQL task type
+    """
+    return Task(
+        id=task.id,
+        title=task.title,
+        description=task.description,
+        completed=task.completed,
+    )
+
+
+class TaskProjection:
+    """
+    Cache of GraphQL tasks built from the task service.
+
+    Each entry remembers the stored task it was built from. Stored tasks are
+    frozen and replaced on every update, so an entry is current exactly
+    while the service still holds that same instance, and writes made
+    outside GraphQL only refresh the entries they touched. The full list is
+    additionally keyed on the service's write version. Returned objects and
+    lists are shared, and callers must treat them as read-only.
+    """
+
+    __slots__ = ("_service", "_version", "_by_id", "_all")
+
+    def __init__(self, service: TaskService) -> None:
+        """
+        Initialize an empty projection of the given service.
+
+        Args:
+            service: The task service whose tasks are projected
+        """
+        self._service = service
+        self._version = -1
+        self._by_id: Dict[int, Tuple[StoredTask, Task]] = {}
+        self._all: Optional[List[Task]] = None
+
+    def put(self, task: StoredTask) -> Task:
+        """
+        Return the GraphQL type for a stored task, building it only if needed.
+
+        Args:
+            task: The stored task, as returned by the service
+
+        Returns:
+            Task: The GraphQL task type
+        """
+        entry = self._by_id.get(task.id)
+        if entry is None or entry[0] is not task:
+            entry = self._by_id[task.id] = (task, to_graphql_task(task))
+        return entry[1]
+
+    def drop(self, task_id: int) -> None:
+        """
+        Remove the cached entry of a deleted task.
+
+        Args:
+            task_id: The ID of the deleted task
+        """
+        self._by_id.pop(task_id, None)
+
+    def get(self, task_id: int) -> Optional[Task]:
+        """
+        Retrieve a specific task by ID as a GraphQL type.
+
+        Args:
+            task_id: The ID of the task to retrieve
+
+        Returns:
+            Optional[Task]: The GraphQL task if found, None otherwise
+        """
+        task = self._service.get_task_by_id(task_id)
+        if task is None:
+            self.drop(task_id)
+            return None
+        return self.put(task)
+
+    def get_many(self, task_ids: List[int]) -> List[Optional[Task]]:
+        """
+        Retrieve several tasks by ID as GraphQL types in one pass.
+
+        Args:
+            task_ids: The IDs of the tasks to retrieve
+
+        Returns:
+            List[Optional[Task]]: The tasks in the same order as the IDs,
+            with None for IDs that were not found
+        """
+        get = self.get
+        return [get(task_id) for task_id in task_ids]
+
+    def all(self) -> List[Task]:
+        """
+        Retrieve all tasks as GraphQL types.
+
+        The list is rebuilt after each write, reusing the entries of tasks
+        that did not change and discarding those of deleted tasks.
+
+        Returns:
+            List[Task]: All tasks in creation order
+        """
+        version = self._service.version
+        if self._all is None or version != self._version:
+            previous = self._by_id
+            by_id: Dict[int, Tuple[StoredTask, Task]] = {}
+            graphql_tasks = []
+            for task in self._service.get_all_tasks():
+                entry = previous.get(task.id)
+                if entry is None or entry[0] is not task:
+                    entry = (task, to_graphql_task(task))
+                by_id[task.id] = entry
+                graphql_tasks.append(entry[1])
+            self._by_id = by_id
+            self._all = graphql_tasks
+            self._version = version
+        return self._all
+
+
+# Projection of the singleton task service shared by the resolvers and loaders
+task_projection = TaskProjection(task_service_instance)
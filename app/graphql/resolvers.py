@@ -8,33 +8,55 @@ for task operations using Strawberry GraphQL.
 from typing import List, Optional
 
 import strawberry
-from strawberry.exceptions import GraphQLError
+from strawberry.type import get_object_definition
+from strawberry.types import Info
 
+from app.graphql.projection import task_projection
 from app.graphql.types import Task, TaskInput, TaskUpdateInput
 from app.models.exceptions import TaskNotFoundException
 from app.models.task import TaskCreate, TaskUpdate
-from app.services import task_service_instance
-
-# Use the singleton task service instance
-task_service = task_service_instance
-
-
-def convert_to_graphql_task(pydantic_task) -> Task:
+from app.services import task_service_instance as task_service
+
+# Bound methods of the singleton task service, which REST and GraphQL share;
+# resolved once at import instead of on every call
+_create = task_service.create_task
+_update = task_service.update_task
+_update_404 = task_service.update_task_or_404
+_delete = task_service.delete_task
+_delete_404 = task_service.delete_task_or_404
+# Bound methods of the GraphQL projection of that service
+_get_all = task_projection.all
+_project = task_projection.put
+_drop = task_projection.drop
+
+
+# Optional fields of TaskUpdateInput, read once from the Strawberry definition
+# so new optional input fields are picked up without touching the resolvers
+_UPDATE_FIELDS = tuple(
+    field.python_name
+    for field in get_object_definition(TaskUpdateInput, strict=True).fields
+)
+
+
+def convert_to_task_update(task_input: TaskUpdateInput) -> TaskUpdate:
     """
-    Convert a Pydantic Task to GraphQL Task.
+    Convert a GraphQL update input to a Pydantic TaskUpdate.
+
+    Only the provided (non-None) values are kept. Strawberry has already
+    validated their types, so the model is built without re-validating them.
 
     Args:
-        pydantic_task: The Pydantic task model
+        task_input: The GraphQL update input
 
     Returns:
-        Task: The GraphQL task type
+        TaskUpdate: The Pydantic update model
     """
-    return Task(
-        id=pydantic_task.id,
-        title=pydantic_task.title,
-        description=pydantic_task.description,
-        completed=pydantic_task.completed,
-    )
+    update_data = {
+        field: value
+        for field in _UPDATE_FIELDS
+        if (value := getattr(task_input, field)) is not None
+    }
+    return TaskUpdate.model_construct(**update_data)
 
 
 @strawberry.type
@@ -51,67 +73,48 @@ class Query:
         Returns:
             List[Task]: List of all tasks
         """
-        pydantic_tasks = task_service.get_all_tasks()
-        return [
-            Task(
-                id=task.id,
-                title=task.title,
-                description=task.description,
-                completed=task.completed,
-            )
-            for task in pydantic_tasks
-        ]
+        return _get_all()
 
     @strawberry.field
-    def task(self, task_id: int) -> Optional[Task]:
+    async def task(self, task_id: int, info: Info) -> Optional[Task]:
         """
         Get a specific task by ID.
 
+        Lookups go through the request's task loader, so several task
+        fields in one operation are resolved with a single batch.
+
         Args:
             task_id: The ID of the task to retrieve
+            info: The resolver info holding the request context
 
         Returns:
             Optional[Task]: The task if found, None otherwise
         """
-        pydantic_task = task_service.get_task_by_id(task_id)
-        if not pydantic_task:
-            return None
-
-        return Task(
-            id=pydantic_task.id,
-            title=pydantic_task.title,
-            description=pydantic_task.description,
-            completed=pydantic_task.completed,
-        )
+        return await info.context["task_loader"].load(task_id)
 
     @strawberry.field
-    def task_strict(self, task_id: int) -> Task:
+    async def task_strict(self, task_id: int, info: Info) -> Task:
         """
         Get a specific task by ID with strict error handling.
 
-        This method raises a GraphQL error if the task is not found,
-        providing explicit error information in the response.
+        Shares the request's task loader with the task field. A missing
+        task raises TaskNotFoundException, which the schema's
+        TaskErrorExtension reports as a TASK_NOT_FOUND GraphQL error.
 
         Args:
             task_id: The ID of the task to retrieve
+            info: The resolver info holding the request context
 
         Returns:
             Task: The task if found
 
         Raises:
-            GraphQLError: If the task is not found
+            TaskNotFoundException: If the task is not found
         """
-        try:
-            return convert_to_graphql_task(task_service.get_task_by_id_or_404(task_id))
-        except TaskNotFoundException as e:
-            raise GraphQLError(
-                message=str(e.detail),
-                extensions={
-                    "code": "TASK_NOT_FOUND",
-                    "task_id": task_id,
-                    "http_status": e.status_code,
-                },
-            ) from e
+        task = await info.context["task_loader"].load(task_id)
+        if task is None:
+            raise TaskNotFoundException(task_id)
+        return task
 
 
 @strawberry.type
@@ -131,20 +134,15 @@ class Mutation:
         Returns:
             Task: The created task
         """
-        task_create = TaskCreate(
+        # Strawberry has already validated the input types at the boundary
+        task_create = TaskCreate.model_construct(
             title=task_input.title,
             description=task_input.description,
             completed=task_input.completed,
         )
 
-        pydantic_task = task_service.create_task(task_create)
-
-        return Task(
-            id=pydantic_task.id,
-            title=pydantic_task.title,
-            description=pydantic_task.description,
-            completed=pydantic_task.completed,
-        )
+        pydantic_task = _create(task_create)
+        return _project(pydantic_task)
 
     @strawberry.mutation
     def update_task(self, task_id: int, task_input: TaskUpdateInput) -> Optional[Task]:
@@ -158,35 +156,21 @@ class Mutation:
         Returns:
             Optional[Task]: The updated task if found, None otherwise
         """
-        # Create TaskUpdate object with only non-None values
-        update_data = {}
-        if task_input.title is not None:
-            update_data["title"] = task_input.title
-        if task_input.description is not None:
-            update_data["description"] = task_input.description
-        if task_input.completed is not None:
-            update_data["completed"] = task_input.completed
-
-        task_update = TaskUpdate(**update_data)
-        pydantic_task = task_service.update_task(task_id, task_update)
+        task_update = convert_to_task_update(task_input)
+        pydantic_task = _update(task_id, task_update)
 
         if not pydantic_task:
             return None
 
-        return Task(
-            id=pydantic_task.id,
-            title=pydantic_task.title,
-            description=pydantic_task.description,
-            completed=pydantic_task.completed,
-        )
+        return _project(pydantic_task)
 
     @strawberry.mutation
     def update_task_strict(self, task_id: int, task_input: TaskUpdateInput) -> Task:
         """
         Update an existing task with strict error handling.
 
-        This method raises a GraphQL error if the task is not found,
-        providing explicit error information in the response.
+        A missing task raises TaskNotFoundException, which the schema's
+        TaskErrorExtension reports as a TASK_NOT_FOUND GraphQL error.
 
         Args:
             task_id: The ID of the task to update
@@ -196,36 +180,11 @@ class Mutation:
             Task: The updated task
 
         Raises:
-            GraphQLError: If the task is not found
+            TaskNotFoundException: If the task is not found
         """
-        try:
-            # Create TaskUpdate object with only non-None values
-            update_data = {}
-            if task_input.title is not None:
-                update_data["title"] = task_input.title
-            if task_input.description is not None:
-                update_data["description"] = task_input.description
-            if task_input.completed is not None:
-                update_data["completed"] = task_input.completed
-
-            task_update = TaskUpdate(**update_data)
-            pydantic_task = task_service.update_task_or_404(task_id, task_update)
-
-            return Task(
-                id=pydantic_task.id,
-                title=pydantic_task.title,
-                description=pydantic_task.description,
-                completed=pydantic_task.completed,
-            )
-        except TaskNotFoundException as e:
-            raise GraphQLError(
-                message=str(e.detail),
-                extensions={
-                    "code": "TASK_NOT_FOUND",
-                    "task_id": task_id,
-                    "http_status": e.status_code,
-                },
-            ) from e
+        task_update = convert_to_task_update(task_input)
+        pydantic_task = _update_404(task_id, task_update)
+        return _project(pydantic_task)
 
     @strawberry.mutation
     def delete_task(self, task_id: int) -> bool:
@@ -238,15 +197,18 @@ class Mutation:
         Returns:
             bool: True if the task was deleted, False if not found
         """
-        return task_service.delete_task(task_id)
+        deleted = _delete(task_id)
+        if deleted:
+            _drop(task_id)
+        return deleted
 
     @strawberry.mutation
     def delete_task_strict(self, task_id: int) -> bool:
         """
         Delete a task with strict error handling.
 
-        This method raises a GraphQL error if the task is not found,
-        providing explicit error information in the response.
+        A missing task raises TaskNotFoundException, which the schema's
+        TaskErrorExtension reports as a TASK_NOT_FOUND GraphQL error.
 
         Args:
             task_id: The ID of the task to delete
@@ -255,16 +217,8 @@ class Mutation:
             bool: True if the task was deleted
 
         Raises:
-            GraphQLError: If the task is not found
+            TaskNotFoundException: If the task is not found
         """
-        try:
-            return task_service.delete_task_or_404(task_id)
-        except TaskNotFoundException as e:
-            raise GraphQLError(
-                message=str(e.detail),
-                extensions={
-                    "code": "TASK_NOT_FOUND",
-                    "task_id": task_id,
-                    "http_status": e.status_code,
-                },
-            ) from e
+        deleted = _delete_404(task_id)
+        _drop(task_id)
+        return deleted
@@ -0,0 +1,51 @@
+"""
+GraphQL router for the TodoList application.
+
+This module provides the FastAPI GraphQL router used to serve the schema,
+with JSON encoding and decoding delegated to orjson.
+"""
+
+from typing import Dict, Union
+
+import orjson
+from strawberry.fastapi import GraphQLRouter
+from strawberry.http import GraphQLHTTPResponse
+from strawberry.http.exceptions import HTTPException
+
+
+class ORJSONGraphQLRouter(GraphQLRouter):
+    """
+    GraphQL router that parses requests and encodes responses with orjson.
+    """
+
+    def parse_json(self, data: Union[str, bytes]) -> Dict[str, str]:
+        """
+        Parse a JSON request body.
+
+        Args:
+            data: The raw request body
+
+        Returns:
+            Dict[str, str]: The decoded GraphQL request
+
+        Raises:
+            HTTPException: 400 if the body is not valid JSON
+        """
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError as e:
+            raise HTTPException(400, "Unable to parse request body as JSON") from e
+
+    def encode_json(  # type: ignore[override]
+        self, response_data: GraphQLHTTPResponse
+    ) -> bytes:
+        """
+        Encode a GraphQL response body.
+
+        Args:
+            response_data: The GraphQL response data
+
+        Returns:
+            bytes: The encoded response, passed to the response unchanged
+        """
+        return orjson.dumps(response_data)
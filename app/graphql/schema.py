@@ -5,9 +5,29 @@ This module creates the main GraphQL schema using Strawberry
 by combining queries and mutations.
 """
 
+from typing import List, Optional, Type, Union
+
 import strawberry
+from strawberry.extensions import ParserCache, SchemaExtension, ValidationCache
 
+from app.config import settings
+from app.graphql.extensions import TaskErrorExtension
 from app.graphql.resolvers import Mutation, Query
 
+# Cache parsed and validated documents so repeated query strings skip both
+# steps; both extensions are shared instances, so the caches live as long as
+# the schema does. Both are None when caching is disabled.
+parser_cache: Optional[ParserCache] = None
+validation_cache: Optional[ValidationCache] = None
+extensions: List[Union[SchemaExtension, Type[SchemaExtension]]] = []
+if settings.graphql_cache_enabled:
+    parser_cache = ParserCache(maxsize=settings.graphql_cache_size)
+    validation_cache = ValidationCache(maxsize=settings.graphql_cache_size)
+    extensions = [parser_cache, validation_cache]
+
+# Map TaskNotFoundException raised by strict resolvers to GraphQL errors; the
+# class is registered so each operation gets its own extension instance
+extensions.append(TaskErrorExtension)
+
 # Create the GraphQL schema
-schema = strawberry.Schema(query=Query, mutation=Mutation)
+schema = strawberry.Schema(query=Query, mutation=Mutation, extensions=extensions)
@@ -22,6 +22,10 @@ class Task:
         completed: Boolean indicating if the task is completed
     """
 
+    # Instances are cached and returned on every read, so drop the per-instance
+    # __dict__; Strawberry resolves fields from the annotations
+    __slots__ = ("id", "title", "description", "completed")
+
     id: int
     title: str
     description: str
@@ -26,6 +26,7 @@ class TaskNotFoundException(HTTPException):
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Task with ID {task_id} not found",
         )
+        self.task_id = task_id
 
 
 class TaskValidationException(HTTPException):
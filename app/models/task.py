@@ -1,39 +1,15 @@
 """
 Task model and schemas for TodoList application.
 
-This module defines the Task data model, enums, and related Pydantic schemas
+This module defines the Task data model and related Pydantic schemas
 for managing todo items.
 """
 
-from datetime import datetime
-from enum import Enum
 from typing import Optional
 
 from pydantic import BaseModel, ConfigDict
 
 
-class TaskStatus(str, Enum):
-    """
-    Task status enumeration.
-    """
-
-    PENDING = "pending"
-    IN_PROGRESS = "in_progress"
-    COMPLETED = "completed"
-    CANCELLED = "cancelled"
-
-
-class TaskPriority(str, Enum):
-    """
-    Task priority enumeration.
-    """
-
-    LOW = "low"
-    MEDIUM = "medium"
-    HIGH = "high"
-    URGENT = "urgent"
-
-
 class TaskBase(BaseModel):
     """
     Base Task schema with common fields.
@@ -65,8 +41,11 @@ class TaskUpdate(BaseModel):
 class Task(TaskBase):
     """
     Complete Task schema with all fields.
+
+    Stored tasks are shared with the service's serialized and GraphQL
+    projections, so they are frozen; updates replace them with a copy.
     """
 
     id: int
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
@@ -8,9 +8,8 @@ with proper error handling and HTTP status codes.
 from typing import List
 
 from fastapi import APIRouter, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
-from app.models.exceptions import TaskNotFoundException
 from app.models.task import Task, TaskCreate, TaskUpdate
 from app.services import task_service_instance
 
@@ -34,14 +33,17 @@ task_service = task_service_instance
     summary="Get all tasks",
     description="Retrieve all tasks from the TodoList.",
 )
-async def get_all_tasks() -> List[Task]:
+async def get_all_tasks() -> ORJSONResponse:
     """
     Get all tasks from the TodoList.
 
+    The cached task dictionaries are already JSON-ready, so they are
+    returned directly instead of being re-validated against the model.
+
     Returns:
-        List[Task]: List of all tasks
+        ORJSONResponse: All tasks in creation order
     """
-    return task_service.get_all_tasks()
+    return ORJSONResponse(task_service.get_all_task_dicts())
 
 
 @router.get(
@@ -54,20 +56,23 @@ async def get_all_tasks() -> List[Task]:
         404: {"description": "Task not found"},
     },
 )
-async def get_task_by_id(task_id: int) -> Task:
+async def get_task_by_id(task_id: int) -> ORJSONResponse:
     """
     Get a specific task by ID.
 
+    The cached task dictionary is already JSON-ready, so it is returned
+    directly instead of being re-validated against the model.
+
     Args:
         task_id: The ID of the task to retrieve
 
     Returns:
-        Task: The task if found
+        ORJSONResponse: The task if found
 
     Raises:
         HTTPException: 404 if task is not found
     """
-    return task_service.get_task_by_id_or_404(task_id)
+    return ORJSONResponse(task_service.get_task_dict_or_404(task_id))
 
 
 @router.post(
@@ -81,17 +86,23 @@ async def get_task_by_id(task_id: int) -> Task:
         400: {"description": "Invalid task data"},
     },
 )
-async def create_task(task_data: TaskCreate) -> Task:
+async def create_task(task_data: TaskCreate) -> ORJSONResponse:
     """
     Create a new task.
 
+    The service serializes the task when storing it, so the cached
+    dictionary is returned instead of re-validating the model.
+
     Args:
         task_data: The task data to create
 
     Returns:
-        Task: The created task
+        ORJSONResponse: The created task
     """
-    return task_service.create_task(task_data)
+    task = task_service.create_task(task_data)
+    return ORJSONResponse(
+        task_service.get_task_dict(task.id), status_code=status.HTTP_201_CREATED
+    )
 
 
 @router.put(
@@ -105,21 +116,25 @@ async def create_task(task_data: TaskCreate) -> Task:
         400: {"description": "Invalid task data"},
     },
 )
-async def update_task(task_id: int, task_data: TaskUpdate) -> Task:
+async def update_task(task_id: int, task_data: TaskUpdate) -> ORJSONResponse:
     """
     Update an existing task.
 
+    The service serializes the task when storing it, so the cached
+    dictionary is returned instead of re-validating the model.
+
     Args:
         task_id: The ID of the task to update
         task_data: The task data to update
 
     Returns:
-        Task: The updated task
+        ORJSONResponse: The updated task
 
     Raises:
         HTTPException: 404 if task is not found
     """
-    return task_service.update_task_or_404(task_id, task_data)
+    task = task_service.update_task_or_404(task_id, task_data)
+    return ORJSONResponse(task_service.get_task_dict(task.id))
 
 
 @router.delete(
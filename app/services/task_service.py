@@ -5,12 +5,14 @@ This module contains the TaskService class that handles all task-related
 business logic and operations.
 """
 
-from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.models.exceptions import TaskNotFoundException
 from app.models.task import Task, TaskCreate, TaskUpdate
 
+# Sentinel for dict.pop so a delete is a single lookup
+_MISSING = object()
+
 
 class TaskService:
     """
@@ -20,29 +22,92 @@ class TaskService:
     including creation, retrieval, updating, and validation.
     """
 
-    def __init__(self):
+    # Closed attribute set: no per-instance __dict__, and a misspelt
+    # attribute assignment fails instead of silently adding state
+    __slots__ = (
+        "tasks_by_id",
+        "_next_id",
+        "_version",
+        "_serialized",
+        "_all_snapshot",
+        "_all_dicts",
+    )
+
+    def __init__(self) -> None:
         """
         Initialize the TaskService with empty data.
         """
-        # In-memory storage for demonstration - starts empty
-        self.tasks_data = []
+        # In-memory storage for demonstration - starts empty, keyed by task ID.
+        # Listing order relies on the dict insertion-order guarantee
+        # (Python 3.7+): updates replace values in place, so tasks keep their
+        # creation position. Moving a task to the end would be pop-and-reinsert
+        # on this dict, not an OrderedDict.
+        self.tasks_by_id: Dict[int, Task] = {}
+        # IDs are never reused, even after the task holding them is deleted
+        self._next_id = 1
+        # Bumped on every write so callers can tell when cached views are stale
+        self._version = 0
+        # JSON-ready dict per task, refreshed on every write for REST reads
+        self._serialized: Dict[int, Dict[str, Any]] = {}
+        # Read-only snapshots of all tasks and of their serialized form,
+        # rebuilt lazily after writes
+        self._all_snapshot: Optional[Tuple[Task, ...]] = None
+        self._all_dicts: Optional[Tuple[Dict[str, Any], ...]] = None
+
+    @property
+    def version(self) -> int:
+        """
+        Counter that changes on every write to the task store.
+
+        Returns:
+            int: The current write version
+        """
+        return self._version
+
+    def _invalidate(self) -> None:
+        """
+        Drop cached projections after the task store changes.
+        """
+        self._version += 1
+        self._all_snapshot = None
+        self._all_dicts = None
 
-    def get_all_tasks(self) -> List[Task]:
+    def clear(self) -> None:
+        """
+        Remove all tasks, restart ID assignment and reset cached projections.
+        """
+        self.tasks_by_id.clear()
+        self._next_id = 1
+        self._serialized.clear()
+        self._invalidate()
+
+    def get_all_tasks(self) -> Tuple[Task, ...]:
         """
         Retrieve all tasks.
 
+        The snapshot is shared between callers until the next write; callers
+        that need to modify it must copy it with list() first.
+
         Returns:
-            List[Task]: List of all tasks
-        """
-        return [
-            Task(
-                id=task["id"],
-                title=task["title"],
-                description=task["description"],
-                completed=task["completed"],
-            )
-            for task in self.tasks_data
-        ]
+            Tuple[Task, ...]: All tasks in creation order
+        """
+        if self._all_snapshot is None:
+            self._all_snapshot = tuple(self.tasks_by_id.values())
+        return self._all_snapshot
+
+    def get_all_task_dicts(self) -> Tuple[Dict[str, Any], ...]:
+        """
+        Retrieve all tasks as serialized dictionaries.
+
+        The snapshot and its dictionaries are shared with the service cache
+        until the next write, so callers must treat them as read-only.
+
+        Returns:
+            Tuple[Dict[str, Any], ...]: All tasks in creation order
+        """
+        if self._all_dicts is None:
+            self._all_dicts = tuple(self._serialized.values())
+        return self._all_dicts
 
     def get_task_by_id(self, task_id: int) -> Optional[Task]:
         """
@@ -54,17 +119,40 @@ class TaskService:
         Returns:
             Optional[Task]: The task if found, None otherwise
         """
-        task_dict = next(
-            (task for task in self.tasks_data if task["id"] == task_id), None
-        )
-        if task_dict:
-            return Task(
-                id=task_dict["id"],
-                title=task_dict["title"],
-                description=task_dict["description"],
-                completed=task_dict["completed"],
-            )
-        return None
+        return self.tasks_by_id.get(task_id)
+
+    def get_task_dict(self, task_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve a specific task by ID as a serialized dictionary.
+
+        The dictionary is shared with the service cache, so callers must
+        treat it as read-only.
+
+        Args:
+            task_id: The ID of the task to retrieve
+
+        Returns:
+            Optional[Dict[str, Any]]: The task data if found, None otherwise
+        """
+        return self._serialized.get(task_id)
+
+    def get_task_dict_or_404(self, task_id: int) -> Dict[str, Any]:
+        """
+        Retrieve a specific task by ID as a serialized dictionary or raise 404.
+
+        Args:
+            task_id: The ID of the task to retrieve
+
+        Returns:
+            Dict[str, Any]: The task data if found
+
+        Raises:
+            TaskNotFoundException: If the task is not found
+        """
+        task_dict = self._serialized.get(task_id)
+        if task_dict is None:
+            raise TaskNotFoundException(task_id)
+        return task_dict
 
     def get_task_by_id_or_404(self, task_id: int) -> Task:
         """
@@ -79,8 +167,8 @@ class TaskService:
         Raises:
             TaskNotFoundException: If the task is not found
         """
-        task = self.get_task_by_id(task_id)
-        if not task:
+        task = self.tasks_by_id.get(task_id)
+        if task is None:
             raise TaskNotFoundException(task_id)
         return task
 
@@ -94,21 +182,14 @@ class TaskService:
         Returns:
             Task: The created task
         """
-        new_id = max([task["id"] for task in self.tasks_data], default=0) + 1
-        new_task = {
-            "id": new_id,
-            "title": task_data.title,
-            "description": task_data.description,
-            "completed": task_data.completed,
-        }
-        self.tasks_data.append(new_task)
-
-        return Task(
-            id=new_task["id"],
-            title=new_task["title"],
-            description=new_task["description"],
-            completed=new_task["completed"],
-        )
+        new_id = self._next_id
+        self._next_id += 1
+        new_task = Task(id=new_id, **task_data.model_dump())
+        self.tasks_by_id[new_id] = new_task
+        self._serialized[new_id] = new_task.model_dump()
+        self._invalidate()
+
+        return new_task
 
     def update_task(self, task_id: int, task_data: TaskUpdate) -> Optional[Task]:
         """
@@ -121,26 +202,10 @@ class TaskService:
         Returns:
             Optional[Task]: The updated task if found, None otherwise
         """
-        task_dict = next(
-            (task for task in self.tasks_data if task["id"] == task_id), None
-        )
-        if not task_dict:
+        task = self.tasks_by_id.get(task_id)
+        if task is None:
             return None
-
-        # Update fields if provided
-        if task_data.title is not None:
-            task_dict["title"] = task_data.title
-        if task_data.description is not None:
-            task_dict["description"] = task_data.description
-        if task_data.completed is not None:
-            task_dict["completed"] = task_data.completed
-
-        return Task(
-            id=task_dict["id"],
-            title=task_dict["title"],
-            description=task_dict["description"],
-            completed=task_dict["completed"],
-        )
+        return self._apply_update(task, task_data)
 
     def update_task_or_404(self, task_id: int, task_data: TaskUpdate) -> Task:
         """
@@ -156,10 +221,32 @@ class TaskService:
         Raises:
             TaskNotFoundException: If the task is not found
         """
-        task = self.update_task(task_id, task_data)
-        if not task:
+        task = self.tasks_by_id.get(task_id)
+        if task is None:
             raise TaskNotFoundException(task_id)
-        return task
+        return self._apply_update(task, task_data)
+
+    def _apply_update(self, task: Task, task_data: TaskUpdate) -> Task:
+        """
+        Store a patched copy of a task and refresh its projections.
+
+        Args:
+            task: The stored task to update
+            task_data: The task data to update
+
+        Returns:
+            Task: The updated task
+        """
+        # Apply only the fields the caller set; Task fields are not nullable,
+        # so an explicit None leaves the stored value unchanged
+        patch = task_data.model_dump(exclude_unset=True, exclude_none=True)
+        updated_task = task.model_copy(update=patch)
+        task_id = updated_task.id
+        self.tasks_by_id[task_id] = updated_task
+        self._serialized[task_id] = updated_task.model_dump()
+        self._invalidate()
+
+        return updated_task
 
     def delete_task(self, task_id: int) -> bool:
         """
@@ -171,13 +258,20 @@ class TaskService:
         Returns:
             bool: True if task was deleted, False if not found
         """
-        task_index = next(
-            (i for i, task in enumerate(self.tasks_data) if task["id"] == task_id), None
-        )
-        if task_index is not None:
-            self.tasks_data.pop(task_index)
-            return True
-        return False
+        if self.tasks_by_id.pop(task_id, _MISSING) is _MISSING:
+            return False
+        self._drop_projections(task_id)
+        return True
+
+    def _drop_projections(self, task_id: int) -> None:
+        """
+        Remove the cached projections of a deleted task.
+
+        Args:
+            task_id: The ID of the deleted task
+        """
+        self._serialized.pop(task_id, None)
+        self._invalidate()
 
     def delete_task_or_404(self, task_id: int) -> bool:
         """
@@ -192,7 +286,7 @@ class TaskService:
         Raises:
             TaskNotFoundException: If the task is not found
         """
-        success = self.delete_task(task_id)
-        if not success:
+        if self.tasks_by_id.pop(task_id, _MISSING) is _MISSING:
             raise TaskNotFoundException(task_id)
-        return success
+        self._drop_projections(task_id)
+        return True
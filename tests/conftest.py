@@ -0,0 +1,83 @@
+"""
+Shared pytest fixtures for the TodoList test suite.
+
+This module provides the fixtures used across test modules, such as
+the HTTP client for the FastAPI application and standalone task services.
+"""
+
+import asyncio
+from functools import partial
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.models.task import TaskCreate
+from app.services import TaskService, task_service_instance
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """Run every async test and fixture on one event loop per session."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    """Create one async HTTP client that calls the app in-process."""
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://test"
+    ) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def post_graphql(client):
+    """Bind client.post to the GraphQL endpoint for the whole session."""
+    return partial(client.post, "/graphql")
+
+
+@pytest_asyncio.fixture(scope="session", autouse=True)
+async def warm_up(client):
+    """Serve one REST and one GraphQL request before the first test runs."""
+    await client.get("/health")
+    await client.post("/graphql", json={"query": "{ __typename }"})
+
+
+@pytest.fixture(scope="module")
+def readonly_service():
+    """Create one TaskService per module for tests that never write to it."""
+    return TaskService()
+
+
+@pytest.fixture
+def service():
+    """Create a fresh TaskService for tests that create, update or delete tasks."""
+    return TaskService()
+
+
+@pytest.fixture(autouse=True)
+def clear_tasks():
+    """Clear all tasks before each test to ensure clean state."""
+    # Access the global task service instance used by the routers and resolvers
+    task_service_instance.clear()
+
+
+@pytest.fixture
+def shared_service(clear_tasks):
+    """Return the task service instance behind the REST and GraphQL endpoints."""
+    return task_service_instance
+
+
+@pytest.fixture
+def created_task(shared_service):
+    """Create one task in the shared service and return its serialized data."""
+    task = shared_service.create_task(
+        TaskCreate(title="Test Task", description="Test description")
+    )
+    return task.model_dump()
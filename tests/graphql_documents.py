@@ -0,0 +1,84 @@
+"""
+GraphQL documents shared by the TodoList test modules.
+
+Values are passed as variables, so the server parses and validates each
+document once.
+"""
+
+GET_TASKS_QUERY = """
+query {
+    tasks {
+        id
+        title
+        description
+        completed
+    }
+}
+"""
+
+GET_TASK_QUERY = """
+query GetTask($id: Int!) {
+    task(taskId: $id) {
+        id
+        title
+        description
+        completed
+    }
+}
+"""
+
+GET_TASK_STRICT_QUERY = """
+query GetTaskStrict($id: Int!) {
+    taskStrict(taskId: $id) {
+        id
+        title
+        description
+        completed
+    }
+}
+"""
+
+CREATE_TASK_MUTATION = """
+mutation CreateTask($input: TaskInput!) {
+    createTask(taskInput: $input) {
+        id
+        title
+        description
+        completed
+    }
+}
+"""
+
+UPDATE_TASK_MUTATION = """
+mutation UpdateTask($id: Int!, $input: TaskUpdateInput!) {
+    updateTask(taskId: $id, taskInput: $input) {
+        id
+        title
+        description
+        completed
+    }
+}
+"""
+
+UPDATE_TASK_STRICT_MUTATION = """
+mutation UpdateTaskStrict($id: Int!, $input: TaskUpdateInput!) {
+    updateTaskStrict(taskId: $id, taskInput: $input) {
+        id
+        title
+        description
+        completed
+    }
+}
+"""
+
+DELETE_TASK_MUTATION = """
+mutation DeleteTask($id: Int!) {
+    deleteTask(taskId: $id)
+}
+"""
+
+DELETE_TASK_STRICT_MUTATION = """
+mutation DeleteTaskStrict($id: Int!) {
+    deleteTaskStrict(taskId: $id)
+}
+"""
@@ -5,54 +5,44 @@ This module contains tests that demonstrate different approaches
 to error handling in both REST and GraphQL APIs.
 """
 
-import pytest
-from fastapi.testclient import TestClient
-
-from app.main import app
-from app.services import task_service_instance
+import asyncio
 
-client = TestClient(app)
+import pytest
 
+from tests import graphql_documents as documents
 
-@pytest.fixture(autouse=True)
-def clear_tasks():
-    """Clear all tasks before each test to ensure clean state."""
-    task_service_instance.tasks_data.clear()
+pytestmark = pytest.mark.asyncio
 
 
 class TestRESTErrorHandling:
     """Test REST API error handling with proper HTTP status codes."""
 
-    def test_get_nonexistent_task_returns_404(self):
-        """Test that getting a non-existent task returns 404."""
-        response = client.get("/api/v1/tasks/999")
-
-        assert response.status_code == 404
-        data = response.json()
-        assert "detail" in data
-        assert "Task with ID 999 not found" in data["detail"]
-
-    def test_update_nonexistent_task_returns_404(self):
-        """Test that updating a non-existent task returns 404."""
+    @pytest.mark.parametrize("method", ["get", "put", "delete"])
+    async def test_nonexistent_task_returns_404(self, client, method):
+        """Test that reading, updating or deleting a non-existent task returns 404."""
         update_data = {"title": "Updated Task", "completed": True}
 
-        response = client.put("/api/v1/tasks/999", json=update_data)
+        response = await client.request(
+            method,
+            "/api/v1/tasks/999",
+            json=update_data if method == "put" else None,
+        )
 
         assert response.status_code == 404
         data = response.json()
         assert "detail" in data
         assert "Task with ID 999 not found" in data["detail"]
 
-    def test_delete_nonexistent_task_returns_404(self):
-        """Test that deleting a non-existent task returns 404."""
-        response = client.delete("/api/v1/tasks/999")
+    async def test_create_task_missing_required_field_returns_422(self, client):
+        """Test that the API rejects a task without a required field with 422."""
+        response = await client.post(
+            "/api/v1/tasks/", json={"description": "Test description"}
+        )
 
-        assert response.status_code == 404
-        data = response.json()
-        assert "detail" in data
-        assert "Task with ID 999 not found" in data["detail"]
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["body", "title"]
 
-    def test_successful_operations_after_creation(self):
+    async def test_successful_operations_after_creation(self, client):
         """Test that operations work correctly after creating a task."""
         # Create a task
         create_data = {
@@ -61,46 +51,54 @@ class TestRESTErrorHandling:
             "completed": False,
         }
 
-        response = client.post("/api/v1/tasks/", json=create_data)
+        response = await client.post("/api/v1/tasks/", json=create_data)
         assert response.status_code == 201
         task = response.json()
         task_id = task["id"]
+        assert task == {**create_data, "id": task_id}
 
         # Get the task (should work)
-        response = client.get(f"/api/v1/tasks/{task_id}")
+        response = await client.get(f"/api/v1/tasks/{task_id}")
         assert response.status_code == 200
 
         # Update the task (should work)
         update_data = {"completed": True}
-        response = client.put(f"/api/v1/tasks/{task_id}", json=update_data)
+        response = await client.put(f"/api/v1/tasks/{task_id}", json=update_data)
         assert response.status_code == 200
+        assert response.json()["completed"] is True
 
         # Delete the task (should work)
-        response = client.delete(f"/api/v1/tasks/{task_id}")
+        response = await client.delete(f"/api/v1/tasks/{task_id}")
         assert response.status_code == 204
 
         # Try to get deleted task (should return 404)
-        response = client.get(f"/api/v1/tasks/{task_id}")
+        response = await client.get(f"/api/v1/tasks/{task_id}")
         assert response.status_code == 404
 
+    async def test_update_with_explicit_null_keeps_existing_value(
+        self, client, created_task
+    ):
+        """Test that an explicit null in an update does not clear the field."""
+        task_id = created_task["id"]
+
+        response = await client.put(
+            f"/api/v1/tasks/{task_id}", json={"title": None, "completed": True}
+        )
+
+        assert response.status_code == 200
+        task = response.json()
+        assert task["title"] == created_task["title"]
+        assert task["completed"] is True
+
 
 class TestGraphQLErrorHandling:
     """Test GraphQL error handling approaches."""
 
-    def test_graphql_task_returns_null_for_nonexistent(self):
+    async def test_graphql_task_returns_null_for_nonexistent(self, post_graphql):
         """Test that GraphQL task query returns null for non-existent task."""
-        query = """
-        query {
-            task(taskId: 999) {
-                id
-                title
-                description
-                completed
-            }
-        }
-        """
-
-        response = client.post("/graphql", json={"query": query})
+        response = await post_graphql(
+            json={"query": documents.GET_TASK_QUERY, "variables": {"id": 999}}
+        )
         assert response.status_code == 200
 
         data = response.json()
@@ -108,20 +106,13 @@ class TestGraphQLErrorHandling:
         assert data["data"]["task"] is None
         assert "errors" not in data or not data["errors"]
 
-    def test_graphql_task_strict_returns_error_for_nonexistent(self):
+    async def test_graphql_task_strict_returns_error_for_nonexistent(
+        self, post_graphql
+    ):
         """Test that GraphQL taskStrict query returns error for non-existent task."""
-        query = """
-        query {
-            taskStrict(taskId: 999) {
-                id
-                title
-                description
-                completed
-            }
-        }
-        """
-
-        response = client.post("/graphql", json={"query": query})
+        response = await post_graphql(
+            json={"query": documents.GET_TASK_STRICT_QUERY, "variables": {"id": 999}}
+        )
         assert response.status_code == 200
 
         data = response.json()
@@ -135,23 +126,17 @@ class TestGraphQLErrorHandling:
         assert error["extensions"]["task_id"] == 999
         assert error["extensions"]["http_status"] == 404
 
-    def test_graphql_update_task_returns_null_for_nonexistent(self):
+    async def test_graphql_update_task_returns_null_for_nonexistent(self, post_graphql):
         """Test that GraphQL updateTask mutation returns null for non-existent task."""
-        mutation = """
-        mutation {
-            updateTask(taskId: 999, taskInput: {
-                title: "Updated Task"
-                completed: true
-            }) {
-                id
-                title
-                description
-                completed
-            }
-        }
-        """
-
-        response = client.post("/graphql", json={"query": mutation})
+        response = await post_graphql(
+            json={
+                "query": documents.UPDATE_TASK_MUTATION,
+                "variables": {
+                    "id": 999,
+                    "input": {"title": "Updated Task", "completed": True},
+                },
+            },
+        )
         assert response.status_code == 200
 
         data = response.json()
@@ -159,23 +144,19 @@ class TestGraphQLErrorHandling:
         assert data["data"]["updateTask"] is None
         assert "errors" not in data or not data["errors"]
 
-    def test_graphql_update_task_strict_returns_error_for_nonexistent(self):
+    async def test_graphql_update_task_strict_returns_error_for_nonexistent(
+        self, post_graphql
+    ):
         """Test that GraphQL updateTaskStrict mutation returns error for non-existent task."""
-        mutation = """
-        mutation {
-            updateTaskStrict(taskId: 999, taskInput: {
-                title: "Updated Task"
-                completed: true
-            }) {
-                id
-                title
-                description
-                completed
-            }
-        }
-        """
-
-        response = client.post("/graphql", json={"query": mutation})
+        response = await post_graphql(
+            json={
+                "query": documents.UPDATE_TASK_STRICT_MUTATION,
+                "variables": {
+                    "id": 999,
+                    "input": {"title": "Updated Task", "completed": True},
+                },
+            },
+        )
         assert response.status_code == 200
 
         data = response.json()
@@ -188,15 +169,13 @@ class TestGraphQLErrorHandling:
         assert error["extensions"]["code"] == "TASK_NOT_FOUND"
         assert error["extensions"]["task_id"] == 999
 
-    def test_graphql_delete_task_returns_false_for_nonexistent(self):
+    async def test_graphql_delete_task_returns_false_for_nonexistent(
+        self, post_graphql
+    ):
         """Test that GraphQL deleteTask mutation returns false for non-existent task."""
-        mutation = """
-        mutation {
-            deleteTask(taskId: 999)
-        }
-        """
-
-        response = client.post("/graphql", json={"query": mutation})
+        response = await post_graphql(
+            json={"query": documents.DELETE_TASK_MUTATION, "variables": {"id": 999}}
+        )
         assert response.status_code == 200
 
         data = response.json()
@@ -204,15 +183,16 @@ class TestGraphQLErrorHandling:
         assert data["data"]["deleteTask"] is False
         assert "errors" not in data or not data["errors"]
 
-    def test_graphql_delete_task_strict_returns_error_for_nonexistent(self):
+    async def test_graphql_delete_task_strict_returns_error_for_nonexistent(
+        self, post_graphql
+    ):
         """Test that GraphQL deleteTaskStrict mutation returns error for non-existent task."""
-        mutation = """
-        mutation {
-            deleteTaskStrict(taskId: 999)
-        }
-        """
-
-        response = client.post("/graphql", json={"query": mutation})
+        response = await post_graphql(
+            json={
+                "query": documents.DELETE_TASK_STRICT_MUTATION,
+                "variables": {"id": 999},
+            },
+        )
         assert response.status_code == 200
 
         data = response.json()
@@ -224,87 +204,63 @@ class TestGraphQLErrorHandling:
         assert "extensions" in error
         assert error["extensions"]["code"] == "TASK_NOT_FOUND"
 
-    def test_graphql_successful_operations_with_both_approaches(self):
+    async def test_graphql_successful_operations_with_both_approaches(
+        self, post_graphql, created_task
+    ):
         """Test that both GraphQL approaches work correctly with existing tasks."""
-        # Create a task first
-        mutation_create = """
-        mutation {
-            createTask(taskInput: {
-                title: "Test Task"
-                description: "Test description"
-                completed: false
-            }) {
-                id
-                title
-                description
-                completed
-            }
-        }
-        """
-
-        response = client.post("/graphql", json={"query": mutation_create})
-        assert response.status_code == 200
-
-        data = response.json()
-        task_id = data["data"]["createTask"]["id"]
+        task_id = created_task["id"]
 
         # Test regular task query
-        query_regular = f"""
-        query {{
-            task(taskId: {task_id}) {{
-                id
-                title
-                completed
-            }}
-        }}
-        """
-
-        response = client.post("/graphql", json={"query": query_regular})
+        response = await post_graphql(
+            json={"query": documents.GET_TASK_QUERY, "variables": {"id": task_id}}
+        )
         assert response.status_code == 200
         data = response.json()
         assert data["data"]["task"] is not None
         assert data["data"]["task"]["id"] == task_id
 
         # Test strict task query
-        query_strict = f"""
-        query {{
-            taskStrict(taskId: {task_id}) {{
-                id
-                title
-                completed
-            }}
-        }}
-        """
-
-        response = client.post("/graphql", json={"query": query_strict})
+        response = await post_graphql(
+            json={
+                "query": documents.GET_TASK_STRICT_QUERY,
+                "variables": {"id": task_id},
+            }
+        )
         assert response.status_code == 200
         data = response.json()
         assert data["data"]["taskStrict"] is not None
         assert data["data"]["taskStrict"]["id"] == task_id
         assert "errors" not in data or not data["errors"]
 
+    async def test_graphql_invalid_json_body_returns_400(self, post_graphql):
+        """Test that a malformed JSON body is rejected before execution."""
+        response = await post_graphql(
+            content=b"{not json",
+            headers={"content-type": "application/json"},
+        )
+
+        assert response.status_code == 400
+        assert "Unable to parse request body as JSON" in response.text
+
 
 class TestErrorHandlingComparison:
     """Test class to demonstrate the differences between REST and GraphQL error handling."""
 
-    def test_error_response_format_comparison(self):
+    async def test_error_response_format_comparison(self, client, post_graphql):
         """Compare error response formats between REST and GraphQL."""
-        # REST API error response
-        rest_response = client.get("/api/v1/tasks/999")
+        # REST API and GraphQL (strict mode) error responses, requested together
+        rest_response, graphql_response = await asyncio.gather(
+            client.get("/api/v1/tasks/999"),
+            post_graphql(
+                json={
+                    "query": documents.GET_TASK_STRICT_QUERY,
+                    "variables": {"id": 999},
+                },
+            ),
+        )
         assert rest_response.status_code == 404
         rest_data = rest_response.json()
 
-        # GraphQL error response (strict mode)
-        graphql_query = """
-        query {
-            taskStrict(taskId: 999) {
-                id
-                title
-            }
-        }
-        """
-
-        graphql_response = client.post("/graphql", json={"query": graphql_query})
         assert graphql_response.status_code == 200  # GraphQL always returns 200
         graphql_data = graphql_response.json()
 
@@ -6,38 +6,21 @@ using Strawberry GraphQL with FastAPI.
 """
 
 import pytest
-from fastapi.testclient import TestClient
 
-from app.main import app
-from app.services import task_service_instance
-
-client = TestClient(app)
-
-
-@pytest.fixture(autouse=True)
-def clear_tasks():
-    """Clear all tasks before each test to ensure clean state."""
-    # Access the global task service instance used by resolvers
-    task_service_instance.tasks_data.clear()
+from app.graphql.projection import TaskProjection
+from app.graphql.schema import parser_cache, validation_cache
+from app.models.task import TaskCreate, TaskUpdate
+from app.services import TaskService
+from tests import graphql_documents as documents
 
 
+@pytest.mark.asyncio
 class TestGraphQLQueries:
     """Test GraphQL query operations."""
 
-    def test_get_all_tasks_empty(self):
+    async def test_get_all_tasks_empty(self, post_graphql):
         """Test getting all tasks when list is empty."""
-        query = """
-        query {
-            tasks {
-                id
-                title
-                description
-                completed
-            }
-        }
-        """
-
-        response = client.post("/graphql", json={"query": query})
+        response = await post_graphql(json={"query": documents.GET_TASKS_QUERY})
         assert response.status_code == 200
 
         data = response.json()
@@ -45,20 +28,11 @@ class TestGraphQLQueries:
         assert "tasks" in data["data"]
         assert data["data"]["tasks"] == []
 
-    def test_get_task_not_found(self):
+    async def test_get_task_not_found(self, post_graphql):
         """Test getting a task that doesn't exist."""
-        query = """
-        query {
-            task(taskId: 999) {
-                id
-                title
-                description
-                completed
-            }
-        }
-        """
-
-        response = client.post("/graphql", json={"query": query})
+        response = await post_graphql(
+            json={"query": documents.GET_TASK_QUERY, "variables": {"id": 999}}
+        )
         assert response.status_code == 200
 
         data = response.json()
@@ -66,27 +40,24 @@ class TestGraphQLQueries:
         assert data["data"]["task"] is None
 
 
+@pytest.mark.asyncio
 class TestGraphQLMutations:
     """Test GraphQL mutation operations."""
 
-    def test_create_task(self):
+    async def test_create_task(self, post_graphql, shared_service):
         """Test creating a new task."""
-        mutation = """
-        mutation {
-            createTask(taskInput: {
-                title: "Test Task"
-                description: "This is a test task"
-                completed: false
-            }) {
-                id
-                title
-                description
-                completed
-            }
+        task_input = {
+            "title": "Test Task",
+            "description": "This is a test task",
+            "completed": False,
         }
-        """
 
-        response = client.post("/graphql", json={"query": mutation})
+        response = await post_graphql(
+            json={
+                "query": documents.CREATE_TASK_MUTATION,
+                "variables": {"input": task_input},
+            },
+        )
         assert response.status_code == 200
 
         data = response.json()
@@ -94,97 +65,40 @@ class TestGraphQLMutations:
         assert "createTask" in data["data"]
 
         task = data["data"]["createTask"]
+        assert task_input.items() <= task.items()
         assert task["id"] == 1
-        assert task["title"] == "Test Task"
-        assert task["description"] == "This is a test task"
-        assert task["completed"] is False
+        assert shared_service.get_task_dict(task["id"]) == task
 
-    def test_get_task_after_creation(self):
+    async def test_get_task_after_creation(self, post_graphql, created_task):
         """Test getting a task after it's been created."""
-        # First create a task
-        mutation = """
-        mutation {
-            createTask(taskInput: {
-                title: "Another Task"
-                description: "Another test task"
-                completed: true
-            }) {
-                id
-            }
-        }
-        """
-
-        response = client.post("/graphql", json={"query": mutation})
-        assert response.status_code == 200
-
-        # Then get the task
-        query = """
-        query {
-            task(taskId: 1) {
-                id
-                title
-                description
-                completed
-            }
-        }
-        """
-
-        response = client.post("/graphql", json={"query": query})
+        response = await post_graphql(
+            json={
+                "query": documents.GET_TASK_QUERY,
+                "variables": {"id": created_task["id"]},
+            },
+        )
         assert response.status_code == 200
 
         data = response.json()
         assert "data" in data
         assert "task" in data["data"]
 
-        task = data["data"]["task"]
-        assert task["id"] == 1
-        assert task["title"] == "Another Task"
-        assert task["description"] == "Another test task"
-        assert task["completed"] is True
+        assert data["data"]["task"] == created_task
 
-    def test_get_all_tasks_with_data(self):
+    async def test_get_all_tasks_with_data(self, post_graphql, shared_service):
         """Test getting all tasks when there are tasks in the list."""
         # First create two tasks
-        mutation1 = """
-        mutation {
-            createTask(taskInput: {
-                title: "First Task"
-                description: "First test task"
-                completed: false
-            }) {
-                id
-            }
-        }
-        """
-
-        mutation2 = """
-        mutation {
-            createTask(taskInput: {
-                title: "Second Task"
-                description: "Second test task"
-                completed: true
-            }) {
-                id
-            }
-        }
-        """
-
-        client.post("/graphql", json={"query": mutation1})
-        client.post("/graphql", json={"query": mutation2})
+        shared_service.create_task(
+            TaskCreate(title="First Task", description="First test task")
+        )
+        shared_service.create_task(
+            TaskCreate(
+                title="Second Task", description="Second test task", completed=True
+            )
+        )
 
         # Now get all tasks
-        query = """
-        query {
-            tasks {
-                id
-                title
-                description
-                completed
-            }
-        }
-        """
-
-        response = client.post("/graphql", json={"query": query})
+        response = await post_graphql(json={"query": documents.GET_TASKS_QUERY})
         assert response.status_code == 200
 
         data = response.json()
@@ -202,98 +116,46 @@ class TestGraphQLMutations:
         assert tasks[1]["id"] == 2
         assert tasks[1]["title"] == "Second Task"
 
-    def test_update_task(self):
+    async def test_update_task(self, post_graphql, created_task):
         """Test updating an existing task."""
-        # First create a task
-        mutation_create = """
-        mutation {
-            createTask(taskInput: {
-                title: "Original Task"
-                description: "Original description"
-                completed: false
-            }) {
-                id
-            }
-        }
-        """
-
-        client.post("/graphql", json={"query": mutation_create})
-
-        # Then update it
-        mutation_update = """
-        mutation {
-            updateTask(taskId: 1, taskInput: {
-                title: "Updated Task"
-                completed: true
-            }) {
-                id
-                title
-                description
-                completed
-            }
-        }
-        """
-
-        response = client.post("/graphql", json={"query": mutation_update})
+        task_input = {"title": "Updated Task", "completed": True}
+
+        response = await post_graphql(
+            json={
+                "query": documents.UPDATE_TASK_MUTATION,
+                "variables": {"id": created_task["id"], "input": task_input},
+            },
+        )
         assert response.status_code == 200
 
         data = response.json()
         assert "data" in data
         assert "updateTask" in data["data"]
 
-        task = data["data"]["updateTask"]
-        assert task["id"] == 1
-        assert task["title"] == "Updated Task"
-        assert task["description"] == "Original description"  # Should remain unchanged
-        assert task["completed"] is True
+        # Updated fields change, everything else remains unchanged
+        assert data["data"]["updateTask"] == {**created_task, **task_input}
 
-    def test_update_task_not_found(self):
+    async def test_update_task_not_found(self, post_graphql):
         """Test updating a task that doesn't exist."""
-        mutation = """
-        mutation {
-            updateTask(taskId: 999, taskInput: {
-                title: "Non-existent Task"
-            }) {
-                id
-                title
-                description
-                completed
-            }
-        }
-        """
-
-        response = client.post("/graphql", json={"query": mutation})
+        response = await post_graphql(
+            json={
+                "query": documents.UPDATE_TASK_MUTATION,
+                "variables": {"id": 999, "input": {"title": "Non-existent Task"}},
+            },
+        )
         assert response.status_code == 200
 
         data = response.json()
         assert "data" in data
         assert data["data"]["updateTask"] is None
 
-    def test_delete_task(self):
+    async def test_delete_task(self, post_graphql, created_task):
         """Test deleting an existing task."""
-        # First create a task
-        mutation_create = """
-        mutation {
-            createTask(taskInput: {
-                title: "Task to Delete"
-                description: "This task will be deleted"
-                completed: false
-            }) {
-                id
-            }
-        }
-        """
+        variables = {"id": created_task["id"]}
 
-        client.post("/graphql", json={"query": mutation_create})
-
-        # Then delete it
-        mutation_delete = """
-        mutation {
-            deleteTask(taskId: 1)
-        }
-        """
-
-        response = client.post("/graphql", json={"query": mutation_delete})
+        response = await post_graphql(
+            json={"query": documents.DELETE_TASK_MUTATION, "variables": variables}
+        )
         assert response.status_code == 200
 
         data = response.json()
@@ -302,45 +164,261 @@ class TestGraphQLMutations:
         assert data["data"]["deleteTask"] is True
 
         # Verify task is deleted by trying to get it
+        response = await post_graphql(
+            json={"query": documents.GET_TASK_QUERY, "variables": variables}
+        )
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["data"]["task"] is None
+
+    async def test_delete_task_not_found(self, post_graphql):
+        """Test deleting a task that doesn't exist."""
+        response = await post_graphql(
+            json={"query": documents.DELETE_TASK_MUTATION, "variables": {"id": 999}}
+        )
+        assert response.status_code == 200
+
+        data = response.json()
+        assert "data" in data
+        assert "deleteTask" in data["data"]
+        assert data["data"]["deleteTask"] is False
+
+
+@pytest.mark.asyncio
+class TestGraphQLTaskLoader:
+    """Test batching of task lookups within a single GraphQL request."""
+
+    @pytest.fixture
+    def batches(self, monkeypatch):
+        """Record the task IDs of every batch the task loader requests."""
+        recorded = []
+        get_tasks = TaskProjection.get_many
+
+        def record_batch(projection, task_ids):
+            recorded.append(list(task_ids))
+            return get_tasks(projection, task_ids)
+
+        # TaskProjection uses __slots__, so patch the method on the class
+        monkeypatch.setattr(TaskProjection, "get_many", record_batch)
+        return recorded
+
+    async def test_aliased_task_queries_are_batched(
+        self, post_graphql, shared_service, batches
+    ):
+        """Test that aliased task fields are loaded with one service call."""
+        shared_service.create_task(TaskCreate(title="First", description="First task"))
+        shared_service.create_task(
+            TaskCreate(title="Second", description="Second task")
+        )
+
         query = """
         query {
-            task(taskId: 1) {
-                id
-            }
+            first: task(taskId: 1) { id title }
+            second: task(taskId: 2) { id title }
+            again: task(taskId: 1) { id }
+            missing: task(taskId: 999) { id }
         }
         """
 
-        response = client.post("/graphql", json={"query": query})
+        response = await post_graphql(json={"query": query})
         assert response.status_code == 200
 
-        data = response.json()
-        assert data["data"]["task"] is None
+        data = response.json()["data"]
+        assert data["first"]["title"] == "First"
+        assert data["second"]["title"] == "Second"
+        assert data["again"]["id"] == 1
+        assert data["missing"] is None
+        assert batches == [[1, 2, 999]]
 
-    def test_delete_task_not_found(self):
-        """Test deleting a task that doesn't exist."""
-        mutation = """
-        mutation {
-            deleteTask(taskId: 999)
+    async def test_task_and_task_strict_share_one_batch(
+        self, post_graphql, shared_service, batches
+    ):
+        """Test that task and taskStrict fields are loaded together."""
+        shared_service.create_task(TaskCreate(title="First", description="First task"))
+
+        query = """
+        query {
+            task(taskId: 1) { id }
+            taskStrict(taskId: 1) { id title }
         }
         """
 
-        response = client.post("/graphql", json={"query": mutation})
+        response = await post_graphql(json={"query": query})
         assert response.status_code == 200
 
-        data = response.json()
-        assert "data" in data
-        assert "deleteTask" in data["data"]
-        assert data["data"]["deleteTask"] is False
+        data = response.json()["data"]
+        assert data["task"]["id"] == 1
+        assert data["taskStrict"]["title"] == "First"
+        assert batches == [[1]]
+
+
+@pytest.mark.asyncio
+class TestGraphQLDocumentCache:
+    """Test caching of parsed and validated GraphQL documents."""
+
+    @pytest.mark.skipif(
+        parser_cache is None or validation_cache is None,
+        reason="GraphQL document caching is disabled",
+    )
+    async def test_repeated_query_reuses_cached_document(self, client):
+        """Test that repeating a query string hits the parser and validation caches."""
+        query = "{ tasks { id title } }"
 
+        await client.post("/graphql-query", json={"query": query})
+        parse_hits = parser_cache.cached_parse_document.cache_info().hits
+        validate_hits = validation_cache.cached_validate_document.cache_info().hits
 
+        response = await client.post("/graphql-query", json={"query": query})
+        assert response.status_code == 200
+        assert response.json()["data"] == {"tasks": []}
+
+        assert parser_cache.cached_parse_document.cache_info().hits == parse_hits + 1
+        assert (
+            validation_cache.cached_validate_document.cache_info().hits
+            == validate_hits + 1
+        )
+
+    async def test_cached_validation_errors_are_returned(self, client):
+        """Test that an invalid query keeps returning its validation errors."""
+        query = "{ unknownField }"
+
+        for _ in range(2):
+            response = await client.post("/graphql-query", json={"query": query})
+            assert response.status_code == 200
+
+            data = response.json()
+            assert data["data"] is None
+            assert "unknownField" in data["errors"][0]["message"]
+
+
+@pytest.mark.asyncio
 class TestHealthCheck:
     """Test health check endpoint."""
 
-    def test_health_check(self):
+    async def test_health_check(self, client):
         """Test the health check endpoint."""
-        response = client.get("/health")
+        response = await client.get("/health")
         assert response.status_code == 200
 
         data = response.json()
         assert data["status"] == "healthy"
         assert data["service"] == "TodoList GraphQL API"
+
+
+@pytest.mark.asyncio
+class TestGraphQLSchemaPage:
+    """Test the GraphQL schema documentation endpoint."""
+
+    async def test_graphql_schema_page_lists_types(self, client):
+        """Test that the schema page renders the escaped SDL."""
+        response = await client.get("/graphql-schema")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/html")
+
+        assert "type Task {" in response.text
+        assert "createTask(taskInput: TaskInput!): Task!" in response.text
+
+
+class TestGraphQLTaskProjection:
+    """Test the cached GraphQL projection of the task service."""
+
+    def test_all_is_cached_until_write(self, service):
+        """Test that the GraphQL task list is reused between writes."""
+        projection = TaskProjection(service)
+        created_task = service.create_task(
+            TaskCreate(title="Cached Task", description="Cached description")
+        )
+
+        first = projection.all()
+        assert projection.all() is first
+        assert first[0].title == "Cached Task"
+
+        service.update_task(created_task.id, TaskUpdate(title="Renamed"))
+        updated = projection.all()
+        assert updated is not first
+        assert updated[0].title == "Renamed"
+
+        service.delete_task(created_task.id)
+        assert projection.all() == []
+
+    def test_clear_resets_projection(self, service):
+        """Test that clearing the service empties the cached projection."""
+        projection = TaskProjection(service)
+        service.create_task(TaskCreate(title="Task", description="Cleared task"))
+        assert len(projection.all()) == 1
+
+        service.clear()
+
+        assert projection.all() == []
+
+    def test_get_tracks_writes(self, service):
+        """Test that a projected task is refreshed on update and removed on delete."""
+        projection = TaskProjection(service)
+        created_task = service.create_task(
+            TaskCreate(title="Test Task", description="Tracked task")
+        )
+
+        graphql_task = projection.get(created_task.id)
+        assert graphql_task is not None
+        assert graphql_task.title == "Test Task"
+        assert projection.get(created_task.id) is graphql_task
+
+        service.update_task(created_task.id, TaskUpdate(completed=True))
+        assert projection.get(created_task.id).completed
+
+        service.delete_task(created_task.id)
+        assert projection.get(created_task.id) is None
+
+    def test_write_only_rebuilds_the_written_task(self, service):
+        """Test that updating one task keeps the projected objects of the others."""
+        projection = TaskProjection(service)
+        for title in ("First", "Second"):
+            service.create_task(TaskCreate(title=title, description="Kept task"))
+        first, second = projection.all()
+
+        updated_task = service.update_task(1, TaskUpdate(completed=True))
+
+        assert projection.get(2) is second
+        assert projection.put(updated_task) is not first
+        assert projection.all() == [projection.get(1), second]
+
+    def test_put_reuses_entry_and_drop_removes_it(self, service):
+        """Test that put builds each stored task once and drop forgets it."""
+        projection = TaskProjection(service)
+        created_task = service.create_task(
+            TaskCreate(title="Put Task", description="Projected task")
+        )
+
+        graphql_task = projection.put(created_task)
+        assert graphql_task.title == "Put Task"
+        assert projection.put(created_task) is graphql_task
+        assert projection.get(created_task.id) is graphql_task
+
+        projection.drop(created_task.id)
+        assert projection.put(created_task) is not graphql_task
+
+    def test_get_many_preserves_order(self, service):
+        """Test that batched lookups follow the requested order and mark misses."""
+        projection = TaskProjection(service)
+        for title in ("First", "Second"):
+            service.create_task(TaskCreate(title=title, description="Batch task"))
+
+        tasks = projection.get_many([2, 99999, 1])
+
+        assert [task.title if task else None for task in tasks] == [
+            "Second",
+            None,
+            "First",
+        ]
+
+    def test_listing_order_is_stable_across_updates(self, service):
+        """Test that updating a task keeps it at its creation position."""
+        projection = TaskProjection(service)
+        for title in ("First", "Second", "Third"):
+            service.create_task(TaskCreate(title=title, description=f"{title} task"))
+
+        service.update_task(1, TaskUpdate(title="First updated"))
+
+        titles = ["First updated", "Second", "Third"]
+        assert [task.title for task in projection.all()] == titles
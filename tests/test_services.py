@@ -2,13 +2,29 @@
 Unit tests for TodoList service classes.
 
 This module contains unit tests for the business logic layer services
-including TaskService.
+including TaskService, and for the task schemas they accept.
 """
 
 import pytest
-
-from app.models.task import TaskCreate, TaskUpdate
-from app.services.task_service import TaskService
+from pydantic import ValidationError
+
+from app.models.task import Task, TaskCreate, TaskUpdate
+
+# Trusted test inputs, built once with model_construct so tests skip
+# validation; the service only reads them, so sharing them is safe
+SAMPLE_CREATE = TaskCreate.model_construct(
+    title="Test Task", description="Test description", completed=False
+)
+ORIGINAL_CREATE = TaskCreate.model_construct(
+    title="Original Task", description="Original description", completed=False
+)
+MULTIPLE_CREATES = tuple(
+    TaskCreate.model_construct(
+        title=f"Task {i}", description=f"Description for task {i}", completed=False
+    )
+    for i in range(1, 4)
+)
+COMPLETE_UPDATE = TaskUpdate.model_construct(completed=True)
 
 
 class TestTaskService:
@@ -16,132 +32,95 @@ class TestTaskService:
     Unit tests for TaskService class.
     """
 
-    def setup_method(self):
-        """
-        Set up test fixtures before each test method.
-        """
-        self.task_service = TaskService()
-
-    def test_get_all_tasks(self):
+    def test_get_all_tasks(self, service):
         """
         Test getting all tasks.
         """
-        tasks = self.task_service.get_all_tasks()
+        tasks = service.get_all_tasks()
         assert len(tasks) == 0  # Should start empty
-        assert isinstance(tasks, list)
+        assert isinstance(tasks, tuple)
 
         # Create a task and verify it appears
-        task_data = TaskCreate(
-            title="Test Task", description="Test description", completed=False
-        )
-        self.task_service.create_task(task_data)
+        service.create_task(SAMPLE_CREATE)
 
-        tasks = self.task_service.get_all_tasks()
+        tasks = service.get_all_tasks()
         assert len(tasks) == 1
-        assert all(hasattr(task, "id") for task in tasks)
-        assert all(hasattr(task, "title") for task in tasks)
-        assert all(hasattr(task, "description") for task in tasks)
-        assert all(hasattr(task, "completed") for task in tasks)
+        assert all(isinstance(task, Task) for task in tasks)
 
-    def test_get_task_by_id_existing(self):
+    def test_get_task_by_id_existing(self, service):
         """
         Test getting an existing task by ID.
         """
         # First create a task
-        task_data = TaskCreate(
-            title="Test Task", description="Test description", completed=False
-        )
-        created_task = self.task_service.create_task(task_data)
+        created_task = service.create_task(SAMPLE_CREATE)
 
         # Then get it by ID
-        task = self.task_service.get_task_by_id(created_task.id)
+        task = service.get_task_by_id(created_task.id)
         assert task is not None
         assert task.id == created_task.id
         assert task.title == "Test Task"
         assert task.completed is False
 
-    def test_get_task_by_id_nonexistent(self):
+    def test_get_task_by_id_nonexistent(self, readonly_service):
         """
         Test getting a non-existent task by ID.
         """
-        task = self.task_service.get_task_by_id(99999)
+        task = readonly_service.get_task_by_id(99999)
         assert task is None
 
-    def test_create_task_success(self):
+    @pytest.mark.parametrize("completed", [False, True])
+    def test_create_task(self, service, completed):
         """
-        Test creating a new task successfully.
+        Test creating a new task, both pending and already completed.
         """
         task_data = TaskCreate(
-            title="Test Task", description="Test description", completed=False
+            title="Test Task", description="Test description", completed=completed
         )
-        created_task = self.task_service.create_task(task_data)
+        created_task = service.create_task(task_data)
 
-        assert created_task.title == "Test Task"
-        assert created_task.description == "Test description"
-        assert created_task.completed is False
+        assert task_data.model_dump().items() <= created_task.model_dump().items()
         assert isinstance(created_task.id, int)
 
-    def test_create_completed_task(self):
-        """
-        Test creating a task that is already completed.
-        """
-        task_data = TaskCreate(
-            title="Completed Task",
-            description="This task is already done",
-            completed=True,
-        )
-        created_task = self.task_service.create_task(task_data)
-
-        assert created_task.title == "Completed Task"
-        assert created_task.completed is True
-
-    def test_update_task_success(self):
+    def test_update_task_success(self, service):
         """
         Test updating a task successfully.
         """
         # First create a task
-        task_data = TaskCreate(
-            title="Original Task", description="Original description", completed=False
-        )
-        created_task = self.task_service.create_task(task_data)
+        created_task = service.create_task(ORIGINAL_CREATE)
 
         # Then update it
         update_data = TaskUpdate(title="Updated Task", completed=True)
-        updated_task = self.task_service.update_task(created_task.id, update_data)
+        updated_task = service.update_task(created_task.id, update_data)
 
         assert updated_task is not None
         assert updated_task.title == "Updated Task"
         assert updated_task.completed is True
 
-    def test_update_task_partial(self):
+    def test_update_task_partial(self, service):
         """
         Test updating only some fields of a task.
         """
         # First create a task
-        task_data = TaskCreate(
-            title="Original Task", description="Original description", completed=False
-        )
-        created_task = self.task_service.create_task(task_data)
+        created_task = service.create_task(ORIGINAL_CREATE)
 
         # Update only completed status
-        update_data = TaskUpdate(completed=True)
-        updated_task = self.task_service.update_task(created_task.id, update_data)
+        updated_task = service.update_task(created_task.id, COMPLETE_UPDATE)
 
         assert updated_task is not None
-        assert updated_task.title == created_task.title  # Unchanged
-        assert updated_task.description == created_task.description  # Unchanged
+        assert updated_task.title == ORIGINAL_CREATE.title  # Unchanged
+        assert updated_task.description == ORIGINAL_CREATE.description  # Unchanged
         assert updated_task.completed is True  # Changed
 
-    def test_update_task_nonexistent(self):
+    def test_update_task_nonexistent(self, service):
         """
         Test updating a non-existent task.
         """
         update_data = TaskUpdate(title="Updated Title")
-        updated_task = self.task_service.update_task(99999, update_data)
+        updated_task = service.update_task(99999, update_data)
 
         assert updated_task is None
 
-    def test_delete_task_success(self):
+    def test_delete_task_success(self, service):
         """
         Test deleting a task successfully.
         """
@@ -149,24 +128,24 @@ class TestTaskService:
         task_data = TaskCreate(
             title="Delete Me", description="Task to delete", completed=False
         )
-        created_task = self.task_service.create_task(task_data)
+        created_task = service.create_task(task_data)
 
         # Delete the task
-        success = self.task_service.delete_task(created_task.id)
+        success = service.delete_task(created_task.id)
         assert success is True
 
         # Verify task is deleted
-        deleted_task = self.task_service.get_task_by_id(created_task.id)
+        deleted_task = service.get_task_by_id(created_task.id)
         assert deleted_task is None
 
-    def test_delete_task_nonexistent(self):
+    def test_delete_task_nonexistent(self, service):
         """
         Test deleting a non-existent task.
         """
-        success = self.task_service.delete_task(99999)
+        success = service.delete_task(99999)
         assert success is False
 
-    def test_task_completion_workflow(self):
+    def test_task_completion_workflow(self, service):
         """
         Test the complete workflow of creating and completing a task.
         """
@@ -176,32 +155,189 @@ class TestTaskService:
             description="Test the complete workflow",
             completed=False,
         )
-        created_task = self.task_service.create_task(task_data)
+        created_task = service.create_task(task_data)
 
         assert created_task.completed is False
 
         # Mark as completed
-        update_data = TaskUpdate(completed=True)
-        completed_task = self.task_service.update_task(created_task.id, update_data)
+        completed_task = service.update_task(created_task.id, COMPLETE_UPDATE)
 
         assert completed_task is not None
         assert completed_task.completed is True
         assert completed_task.title == "Workflow Test"
 
-    def test_multiple_tasks_creation(self):
+    def test_multiple_tasks_creation(self, service):
+        """
+        Test creating several tasks in sequence and verifying they all exist.
+        """
+        created_tasks = []
+        for expected_id, task_data in enumerate(MULTIPLE_CREATES, start=1):
+            task = service.create_task(task_data)
+
+            # Checked per insert, so a failure names the create that broke
+            assert task.id == expected_id, f"insert {expected_id} got id {task.id}"
+            assert task.title == task_data.title
+            created_tasks.append(task)
+
+        assert service.get_all_tasks() == tuple(created_tasks)
+
+    def test_task_ids_are_not_reused_after_delete(self, service):
+        """
+        Test that deleting the newest task does not free its ID for reuse.
+        """
+        first_task = service.create_task(SAMPLE_CREATE)
+        second_task = service.create_task(SAMPLE_CREATE)
+
+        service.delete_task(second_task.id)
+        third_task = service.create_task(SAMPLE_CREATE)
+
+        assert first_task.id == 1
+        assert second_task.id == 2
+        assert third_task.id == 3
+
+    def test_listing_order_is_stable_across_updates(self, service):
+        """
+        Test that updating a task keeps it at its creation position.
+        """
+        for title in ("First", "Second", "Third"):
+            service.create_task(TaskCreate(title=title, description=f"{title} task"))
+
+        service.update_task(1, TaskUpdate(title="First updated"))
+        service.update_task(2, COMPLETE_UPDATE)
+
+        titles = ["First updated", "Second", "Third"]
+        assert [task.title for task in service.get_all_tasks()] == titles
+        assert [task["title"] for task in service.get_all_task_dicts()] == titles
+
+
+class TestTaskServiceCaches:
+    """
+    Unit tests for the stored instances and cached projections of TaskService.
+    """
+
+    def test_update_task_leaves_previous_instance_unchanged(self, service):
+        """
+        Test that updating a task replaces the stored instance instead of mutating it.
+        """
+        created_task = service.create_task(ORIGINAL_CREATE)
+
+        updated_task = service.update_task(
+            created_task.id, TaskUpdate(title="Updated Task")
+        )
+
+        assert created_task.title == "Original Task"
+        assert updated_task.title == "Updated Task"
+        assert service.get_task_by_id(created_task.id) is updated_task
+
+    def test_repeated_get_task_by_id_returns_stored_instance(self, service):
         """
-        Test creating multiple tasks and verifying they all exist.
+        Test that repeated lookups return the stored task without rebuilding it.
         """
-        initial_count = len(self.task_service.get_all_tasks())
+        created_task = service.create_task(SAMPLE_CREATE)
+
+        first = service.get_task_by_id(created_task.id)
+        second = service.get_task_by_id(created_task.id)
+
+        assert first is created_task
+        assert second is first
+
+    def test_get_all_tasks_snapshot_is_shared_until_write(self, service):
+        """
+        Test that the all-tasks snapshot is reused between writes.
+        """
+        service.create_task(SAMPLE_CREATE)
+
+        snapshot = service.get_all_tasks()
+        assert service.get_all_tasks() is snapshot
+
+        service.create_task(SAMPLE_CREATE)
+        refreshed = service.get_all_tasks()
+        assert refreshed is not snapshot
+        assert len(snapshot) == 1
+        assert len(refreshed) == 2
+
+    def test_get_all_task_dicts_snapshot_is_shared_until_write(self, service):
+        """
+        Test that the serialized task list is reused between writes.
+        """
+        service.create_task(SAMPLE_CREATE)
+
+        snapshot = service.get_all_task_dicts()
+        assert service.get_all_task_dicts() is snapshot
+
+        service.create_task(SAMPLE_CREATE)
+        refreshed = service.get_all_task_dicts()
+        assert refreshed is not snapshot
+        assert len(snapshot) == 1
+        assert len(refreshed) == 2
+
+    def test_get_task_dict_tracks_writes(self, service):
+        """
+        Test that the serialized task dictionaries follow creates, updates and deletes.
+        """
+        created_task = service.create_task(SAMPLE_CREATE)
+
+        assert service.get_task_dict(created_task.id) == {
+            "id": created_task.id,
+            "title": "Test Task",
+            "description": "Test description",
+            "completed": False,
+        }
+        assert service.get_all_task_dicts() == (service.get_task_dict(created_task.id),)
+
+        service.update_task(created_task.id, COMPLETE_UPDATE)
+        assert service.get_task_dict(created_task.id)["completed"] is True
 
-        # Create multiple tasks
-        for i in range(3):
-            task_data = TaskCreate(
-                title=f"Task {i+1}",
-                description=f"Description for task {i+1}",
-                completed=False,
-            )
-            self.task_service.create_task(task_data)
+        service.delete_task(created_task.id)
+        assert service.get_task_dict(created_task.id) is None
+        assert service.get_all_task_dicts() == ()
+
+    def test_rejects_unknown_attributes(self, readonly_service):
+        """
+        Test that the service only accepts its declared attributes.
+        """
+        with pytest.raises(AttributeError):
+            readonly_service.tasks_data = []
+
+
+class TestTaskValidation:
+    """
+    Unit tests for task schema validation.
+    """
+
+    @pytest.mark.parametrize("missing_field", ["title", "description"])
+    def test_create_task_missing_required_field(self, missing_field):
+        """
+        Test that a task cannot be created without a required field.
+        """
+        data = {"title": "Test Task", "description": "Test description"}
+        del data[missing_field]
+
+        with pytest.raises(ValidationError) as exc_info:
+            TaskCreate.model_validate(data)
+
+        assert exc_info.value.errors()[0]["loc"] == (missing_field,)
+
+    def test_create_task_invalid_completed_type(self):
+        """
+        Test that the completed flag must be a boolean.
+        """
+        data = {
+            "title": "Test Task",
+            "description": "Test description",
+            "completed": "not a boolean",
+        }
+
+        with pytest.raises(ValidationError) as exc_info:
+            TaskCreate.model_validate(data)
+
+        assert exc_info.value.errors()[0]["loc"] == ("completed",)
+
+    def test_stored_task_is_frozen(self):
+        """
+        Test that a stored task cannot be mutated in place.
+        """
+        task = Task(id=1, title="Test Task", description="Test description")
 
-        final_count = len(self.task_service.get_all_tasks())
-        assert final_count == initial_count + 3
+        with pytest.raises(ValidationError):
+            task.title = "Changed"